@@ -1,5 +1,5 @@
 import cython  # type: ignore
-from typing import Union, List, Dict, Type, Set
+from typing import Union, List, Dict, Type, Set, cast
 
 from .na_position import NAPosition
 from .aa_position import AAPosition
@@ -12,6 +12,12 @@ VALID_NOTATIONS: Dict[Type[Position], Set[int]] = {
     NAPosition: set(b'ACGTUWSMKRYBDHVN.-')
 }
 
+# VALID_NOTATIONS as bytes for bytes.translate(None, delete)
+VALID_NOTATION_BYTES: Dict[Type[Position], bytes] = {
+    seqtype: bytes(sorted(notations))
+    for seqtype, notations in VALID_NOTATIONS.items()
+}
+
 
 @cython.ccall
 @cython.returns(list)
@@ -37,15 +43,17 @@ def sanitize_sequence(
         )
 
     valid_notations: set[int] = VALID_NOTATIONS[seqtype]
-    valids: List[Position] = []
-    invalids: Set[int] = set()
-    for one in seqtext:
-        if one.notation in valid_notations:
-            valids.append(one)
-        else:
-            invalids.add(one.notation)
+    # find invalid notations with one C-level pass over the notation
+    # bytes; the positions are only filtered if any were found
+    invalids: Set[int] = set(
+        NAPosition.as_bytes(cast(List[NAPosition], seqtext))
+        .translate(None, VALID_NOTATION_BYTES[seqtype])
+    )
     if invalids and skip_invalid:
-        seqtext = valids
+        seqtext = [
+            one for one in seqtext
+            if one.notation in valid_notations
+        ]
     elif invalids:
         raise ValueError(
             'sequence {} contains invalid notation(s) ({})'
@@ -9,6 +9,7 @@ class MessageLevel(Enum):
 
 
 class Message:
+    __slots__ = ('seqid', 'level', 'message')
 
     def __init__(self, seqid: int, level: MessageLevel, message: str):
         self.seqid = seqid
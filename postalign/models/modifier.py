@@ -8,6 +8,12 @@ from collections import Counter
 
 
 class Modifier:
+    # instances are hashed by identity (object.__hash__), which is already
+    # constant-time for the child_mods Counter
+    __slots__ = (
+        'text', 'slicetuples', 'child_mods', 'parent_mods',
+        'step', 'root_modifier', '__weakref__'
+    )
 
     text: str
     slicetuples: List[Tuple[int, int]]
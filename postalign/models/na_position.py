@@ -7,11 +7,12 @@ from typing import (
     Optional,
     Type
 )
-from itertools import zip_longest
+from itertools import zip_longest, accumulate
 from .position_flag import PositionFlag
 
 GAP_CHAR: int = ord(b'-')
 GAP_CHARS: Tuple[int, ...] = tuple(b'-.')
+NONGAP_TABLE: bytes = bytes(na not in GAP_CHARS for na in range(256))
 
 FIRST: cython.int = 0
 LAST: cython.int = 1
@@ -20,16 +21,15 @@ LAST: cython.int = 1
 @cython.ccall
 @cython.returns(list)
 def enumerate_seq_pos(seq_text: bytes) -> List[int]:
-    na: int
-    offset: int = 1
-    seq_pos: List[int] = []
-    for na in seq_text:
-        if na in GAP_CHARS:
-            seq_pos.append(-1)
-        else:
-            seq_pos.append(offset)
-            offset += 1
-    return seq_pos
+    pos: int
+    nongap: int
+    # 1 for each non-gap NA, 0 for each gap; the running sum of this
+    # mask is the NA position
+    nongaps: bytes = seq_text.translate(NONGAP_TABLE)
+    return [
+        pos if nongap else -1
+        for pos, nongap in zip(accumulate(nongaps), nongaps)
+    ]
 
 
 @cython.cfunc
@@ -152,14 +152,21 @@ class NAPosition:
     ) -> List['NAPosition']:
         na: int
         pos: int
+        flag: PositionFlag = PositionFlag.NONE
         seq_text = bytes(seq_text).upper()
+        seq_pos: List[int] = enumerate_seq_pos(seq_text)
         if seq_payload is None:
-            seq_payload = []
+            # common case: build positions in a single pass without
+            # padding a payload list to the sequence length
+            return [
+                cls(na, pos, flag)
+                for na, pos in zip(seq_text, seq_pos)
+            ]
         return [
-            cls(na, pos, PositionFlag.NONE, payload)
+            cls(na, pos, flag, payload)
             for na, pos, payload in zip_longest(
                 seq_text,
-                enumerate_seq_pos(seq_text),
+                seq_pos,
                 seq_payload
             )
         ]
@@ -1,23 +1,130 @@
-from typing import Type, TextIO, Iterable, Generator
+import mmap
+import codecs
+from typing import (
+    Type, TextIO, Tuple, Iterable, Iterator, Generator, Optional,
+    Container
+)
 
 from ..models import Sequence, Position
 
 GAP_CHARS = b'.-'
 
+# ASCII characters removed by str.strip()
+ASCII_WHITESPACES = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+
+def map_file(fp: TextIO) -> Optional[mmap.mmap]:
+    """memory-map a text file to read it as raw bytes
+
+    Returns None if `fp` can not be read this way, i.e. it is not a
+    regular UTF-8 file read from the beginning, or it contains carriage
+    returns (line breaks in text mode).
+    """
+    try:
+        if (
+            codecs.lookup(fp.encoding).name != 'utf-8' or
+            fp.errors != 'strict' or
+            fp.tell() != 0
+        ):
+            return None
+        fpmap: mmap.mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, LookupError, TypeError, OSError, ValueError):
+        # no file descriptor (io.UnsupportedOperation is an OSError) or
+        # an empty file
+        return None
+    if fpmap.find(b'\r') > -1:
+        fpmap.close()
+        return None
+    return fpmap
+
+
+def map_lines(fp: TextIO) -> Optional[Iterator[bytes]]:
+    """iterate lines of a text file as raw bytes through mmap
+
+    Returns None if `fp` can not be mapped by `map_file()`.
+    """
+    fpmap: Optional[mmap.mmap] = map_file(fp)
+    if fpmap is None:
+        return None
+
+    def iter_lines(fpmap: mmap.mmap) -> Iterator[bytes]:
+        with fpmap:
+            yield from iter(fpmap.readline, b'')
+    return iter_lines(fpmap)
+
+
+def iter_records(fpmap: mmap.mmap) -> Iterator[Tuple[bytes, bytes]]:
+    """iterate (header line, sequence lines) of a mapped FASTA file
+
+    Records are located with mmap.find() so the sequence lines of a
+    record are sliced out in one piece instead of line by line. The
+    header line includes the leading '>'; lines before the first header
+    are yielded with an empty header line.
+    """
+    size: int = len(fpmap)
+    start: int = 0
+    header_end: int
+    end: int
+    while start < size:
+        end = fpmap.find(b'\n>', start) + 1 or size
+        if fpmap[start] == ord('>'):
+            header_end = fpmap.find(b'\n', start, end)
+            if header_end < 0:
+                header_end = end
+            yield fpmap[start:header_end], fpmap[header_end + 1:end]
+        else:
+            yield b'', fpmap[start:end]
+        start = end
+
+
+def parse_nas(lines: bytes) -> bytes:
+    """join the sequence lines of a record with each line stripped
+
+    Comment lines (start with '#') are skipped; non-ASCII characters
+    are dropped.
+    """
+    nas: bytes = lines.replace(b'\n', b'')
+    if (
+        nas.isascii() and
+        b'#' not in nas and
+        len(nas.translate(None, ASCII_WHITESPACES)) == len(nas)
+    ):
+        # no whitespaces to strip and no comment: the common case
+        return nas
+    result: bytearray = bytearray()
+    line: bytes
+    for line in lines.split(b'\n'):
+        if line.startswith(b'#'):
+            continue
+        elif line.isascii():
+            result.extend(line.strip(ASCII_WHITESPACES))
+        else:
+            result.extend(bytes(line.decode().strip(), 'ASCII', 'ignore'))
+    return bytes(result)
+
 
 def load(
     fp: TextIO,
     seqtype: Type[Position],
     *,
-    remove_gaps: bool = False
+    remove_gaps: bool = False,
+    seqids: Optional[Container[int]] = None
 ) -> Generator[Sequence, None, None]:
+    """load sequences from a FASTA file
+
+    If `seqids` is given, only sequences of these seqids are built and
+    yielded; the seqids of all sequences remain the same.
+    """
     header: str = ''
     curseq: bytearray = bytearray()
     seqid: int = 0
 
-    def make_seq() -> Sequence:
+    def next_seqid_wanted() -> bool:
         nonlocal seqid
         seqid += 1
+        return seqids is None or seqid in seqids
+
+    def make_seq() -> Sequence:
         if remove_gaps:
             for gap in GAP_CHARS:
                 curseq.replace(bytes([gap]), b'')
@@ -35,18 +142,54 @@ def load(
             abs_seqstart=0,
             skip_invalid=True)
 
-    for line in fp:
-        if line.startswith('>'):
-            if header:
-                yield make_seq()
-            header = line[1:].strip()
-            curseq = bytearray()
-        elif line.startswith('#'):
-            continue
-        else:
-            curseq.extend(bytes(line.strip(), 'ASCII', 'ignore'))
-    if header:
-        yield make_seq()
+    fpmap: Optional[mmap.mmap] = map_file(fp)
+    if fpmap is None:
+        for line in fp:
+            if line.startswith('>'):
+                if header and next_seqid_wanted():
+                    yield make_seq()
+                header = line[1:].strip()
+                curseq = bytearray()
+            elif line.startswith('#'):
+                continue
+            else:
+                curseq.extend(bytes(line.strip(), 'ASCII', 'ignore'))
+        if header and next_seqid_wanted():
+            yield make_seq()
+    else:
+        # same as above but record by record; the sequence lines of
+        # unwanted records are never parsed
+        header_line: bytes
+        lines: bytes
+        with fpmap:
+            for header_line, lines in iter_records(fpmap):
+                if not header_line:
+                    # lines before the first header are discarded
+                    continue
+                header = header_line[1:].decode().strip()
+                if header and next_seqid_wanted():
+                    curseq = bytearray(parse_nas(lines))
+                    yield make_seq()
+
+
+def iter_headers(fp: TextIO) -> Optional[Iterator[str]]:
+    """iterate headers of a FASTA file without loading the sequences
+
+    The n-th header is the one of the sequence with seqid n loaded by
+    `load()`. Returns None if `fp` can not be mapped by `map_lines()`.
+    """
+    lines: Optional[Iterator[bytes]] = map_lines(fp)
+    if lines is None:
+        return None
+
+    def headers(lines: Iterator[bytes]) -> Iterator[str]:
+        rawline: bytes
+        for rawline in lines:
+            if rawline[:1] == b'>':
+                header: str = rawline[1:].decode().strip()
+                if header:
+                    yield header
+    return headers(lines)
 
 
 def dump(
@@ -1,7 +1,6 @@
 import click
-from io import StringIO
 from pathlib import Path
-from subprocess import Popen, TimeoutExpired, PIPE
+from subprocess import Popen, TimeoutExpired, PIPE, DEVNULL
 from tempfile import TemporaryDirectory
 from typing import TextIO, List, Iterable, Type
 
@@ -39,26 +38,30 @@ def load(
                     seq.headerdesc,
                     seq.seqtext_as_str
                 ))
+        # minimap2 writes the PAF to a file instead of a pipe, so the
+        # alignments are never held in memory as a whole and can be
+        # memory-mapped by paf.load()
+        pafpath = tempdir / 'alignment.paf'
         proc = Popen(
             [*minimap2_execute,
-             '-c',           # output CIGAR in PAF
-             str(refpath),   # target.fa
-             str(seqpath)],  # query.fa
-            stdout=PIPE,
+             '-c',                # output CIGAR in PAF
+             '-o', str(pafpath),  # alignment.paf
+             str(refpath),        # target.fa
+             str(seqpath)],       # query.fa
+            stdout=DEVNULL,
             stderr=PIPE,
             encoding='utf-8'
         )
         try:
             # TODO: allow to specify timeout through input
-            outs, errs = proc.communicate(timeout=DEFAULT_TIMEOUT)
+            _, errs = proc.communicate(timeout=DEFAULT_TIMEOUT)
         except TimeoutExpired:
             proc.kill()
-            outs, errs = proc.communicate()
+            _, errs = proc.communicate()
         if proc.returncode != 0:
             raise click.ClickException(
                 'Error happened during xecuting minimap2: {}'
                 .format(errs)
             )
-        paffp = StringIO(outs)
-        return paf.load(paffp, seqpath.open(),
+        return paf.load(pafpath.open(), seqpath.open(),
                         refpath.open(), seqtype, messages)
@@ -1,5 +1,5 @@
 import click
-from typing import Type, TextIO, Generator, Iterable
+from typing import Type, TextIO, Generator, Iterable, Iterator, Optional
 from itertools import tee
 
 from ..models import RefSeqPair, Sequence, Position
@@ -13,6 +13,27 @@ def load(
     seqtype: Type[Position]
 ) -> Generator[RefSeqPair, None, None]:
     ref_finder: Iterable[Sequence]
+    if reference:
+        headers: Optional[Iterator[str]] = fasta.iter_headers(msafp)
+        if headers is not None:
+            # locate the reference by headers first, so that sequences
+            # prior to the reference are neither built twice nor buffered
+            ref_seqid: int
+            header: str
+            for ref_seqid, header in enumerate(headers, 1):
+                if header.split(' ', 1)[0] == reference:
+                    break
+            else:
+                raise click.ClickException(
+                    'Unable to locate reference {!r} (--reference)'
+                    .format(reference)
+                )
+            refseq = next(fasta.load(msafp, seqtype, seqids={ref_seqid}))
+            for seq in fasta.load(msafp, seqtype):
+                if seq.seqid != ref_seqid:
+                    yield refseq, seq
+            return
+
     sequences: Iterable[Sequence] = fasta.load(msafp, seqtype)
     ref_finder, sequences = tee(sequences, 2)
 
@@ -1,7 +1,10 @@
-from copy import deepcopy
+import mmap
+from copy import copy
 from collections import defaultdict
-from pafpy import PafRecord, Strand  # type: ignore
-from typing import Type, Iterable, TextIO, List, Dict, Tuple, Set
+from pafpy import Strand, MalformattedRecord  # type: ignore
+from typing import (
+    Type, Iterable, Iterator, TextIO, List, DefaultDict, Tuple, Set
+)
 
 from ..models import (
     Sequence, Position, RefSeqPair, PositionFlag, Message, MessageLevel
@@ -10,6 +13,71 @@ from ..utils.cigar import CIGAR
 
 from . import fasta
 
+PAF_MIN_FIELDS: int = 12
+PAF_CIGAR_TAG: bytes = b'cg:Z:'
+
+
+def iter_paf_lines(paffp: TextIO) -> Iterator[bytes]:
+    """yield raw PAF lines as bytes
+
+    A PAF file on disk is memory-mapped and split by `mmap.readline()`,
+    which skips decoding lines that are only partially used. Other
+    streams (e.g. stdin or minimap2 output) are read as text.
+    """
+    try:
+        pafmap: mmap.mmap = mmap.mmap(
+            paffp.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # not a regular file (io.UnsupportedOperation is an OSError),
+        # or an empty one
+        pafstr: str
+        for pafstr in paffp:
+            yield pafstr.encode()
+        return
+    with pafmap:
+        yield from iter(pafmap.readline, b'')
+
+
+def parse_paf_line(
+    pafline: bytes
+) -> Tuple[str, Strand, int, int, int, int, str]:
+    """parse the fields used by `load()` from a PAF line
+
+    Returns (qname, strand, tstart, tend, qstart, qend, cigar). Unlike
+    `pafpy.PafRecord.from_str()`, tags other than `cg` are not parsed.
+    """
+    # split off the mandatory fields only; the optional tags are searched
+    # for the cg tag as one chunk
+    fields: List[bytes] = pafline.split(b'\t', PAF_MIN_FIELDS)
+    if len(fields) < PAF_MIN_FIELDS:
+        raise MalformattedRecord(
+            f'Expected {PAF_MIN_FIELDS} fields, '
+            f'but got {len(fields)}\n{pafline.decode()}'
+        )
+    tags: bytes = b''
+    if len(fields) > PAF_MIN_FIELDS:
+        tags = fields[PAF_MIN_FIELDS]
+    # duplicated tags: the last one wins
+    cigar_start: int = tags.rfind(b'\t' + PAF_CIGAR_TAG)
+    if cigar_start > -1:
+        cigar_start += len(PAF_CIGAR_TAG) + 1
+    elif tags.startswith(PAF_CIGAR_TAG):
+        cigar_start = len(PAF_CIGAR_TAG)
+    else:
+        raise KeyError('cg')
+    cigar_end: int = tags.find(b'\t', cigar_start)
+    if cigar_end < 0:
+        cigar_end = len(tags)
+    return (
+        fields[0].decode(),
+        Strand(fields[4].decode()),
+        int(fields[7]),
+        int(fields[8]),
+        int(fields[2]),
+        int(fields[3]),
+        tags[cigar_start:cigar_end].decode()
+    )
+
 
 def insert_unaligned_region(
     reftext: List[Position],
@@ -35,29 +103,34 @@ def insert_unaligned_region(
 
     """
 
-    unaligned_ref_size: int = align2_ref_start - align1_ref_end
     unaligned_seq_size: int = align2_seq_start - align1_seq_end
+    if unaligned_seq_size <= 0:
+        # nothing to insert; a negative size means the sequence is
+        # incorrectly concatenated (e.g. PR/RT switched), return to avoid
+        # further damaged alignment
+        return
+    unaligned_ref_size: int = align2_ref_start - align1_ref_end
     offset: int = min(unaligned_ref_size, unaligned_seq_size)
     if insert_close_to == 2:
         offset = unaligned_ref_size - offset
 
-    if unaligned_seq_size < 0:
-        # sequence is incorrectly concatenated (e.g. PR/RT switched);
-        # return to avoid further damaged alignment
-        return
-    if unaligned_ref_size == 0 and unaligned_seq_size == 0:
-        return
-
     reftext[
         align1_ref_end + offset:
         align1_ref_end + offset
     ] = seqtype.init_gaps(unaligned_seq_size)
 
-    unaligneds: List[Position] = deepcopy(orig_seqtext[
+    pos: Position
+    unaligned: Position
+    unaligneds: List[Position] = []
+    # copy and flag the unaligned positions in one pass; shallow copies
+    # suffice since only the flag is changed
+    for pos in orig_seqtext[
         align1_seq_end:
         align1_seq_end + unaligned_seq_size
-    ])
-    seqtype.set_flag(unaligneds, PositionFlag.UNALIGNED)
+    ]:
+        unaligned = copy(pos)
+        unaligned.flag |= PositionFlag.UNALIGNED
+        unaligneds.append(unaligned)
 
     seqtext[
         align1_ref_end + offset:
@@ -82,25 +155,23 @@ def load(
     seqs: Iterable[Sequence] = fasta.load(
         seqs_prior_alignment, seqtype, remove_gaps=True)
 
-    pafstr_iter = (pafstr.strip() for pafstr in paffp)
-    pafrec_iter = (
-        PafRecord.from_str(pafstr)
-        for pafstr in pafstr_iter
-        if pafstr
-    )
-    paf_lookup: Dict[
+    qname: str
+    strand: Strand
+    pafline: bytes
+    paf_lookup: DefaultDict[
         str,
         Set[Tuple[int, int, int, int, str]]
     ] = defaultdict(set)
-    for pafrec in pafrec_iter:
-        if pafrec.strand == Strand.Reverse:
+    for pafline in iter_paf_lines(paffp):
+        pafline = pafline.strip()
+        if not pafline:
+            continue
+        (qname, strand, ref_start, ref_end,
+         seq_start, seq_end, cigar_text) = parse_paf_line(pafline)
+        if strand == Strand.Reverse:
             continue
-        paf_lookup[pafrec.qname].add((
-            pafrec.tstart,
-            pafrec.tend,
-            pafrec.qstart,
-            pafrec.qend,
-            pafrec.tags['cg'].value
+        paf_lookup[qname].add((
+            ref_start, ref_end, seq_start, seq_end, cigar_text
         ))
 
     for seq in seqs:
@@ -215,16 +286,17 @@ def load(
             seq_paf_params.append(
                 '{},{},{}'.format(seq_start, seq_end, cigar_text))
 
-            insert_unaligned_region(
-                final_reftext,
-                final_seqtext,
-                seq.seqtext,
-                seqtype,
-                ref_end,
-                seq_end,
-                prev_ref_start,
-                prev_seq_start
-            )
+            if prev_seq_start > seq_end:
+                insert_unaligned_region(
+                    final_reftext,
+                    final_seqtext,
+                    seq.seqtext,
+                    seqtype,
+                    ref_end,
+                    seq_end,
+                    prev_ref_start,
+                    prev_seq_start
+                )
 
             prev_ref_start = ref_start
             prev_seq_start = seq_start
@@ -232,29 +304,36 @@ def load(
             final_reftext[ref_start:ref_end] = reftext
             final_seqtext[ref_start:ref_end] = seqtext
 
-        insert_unaligned_region(
-            final_reftext,
-            final_seqtext,
-            seq.seqtext,
-            seqtype,
-            0,
-            0,
-            prev_ref_start,
-            prev_seq_start,
-            2
-        )
+        if prev_seq_start > 0:
+            insert_unaligned_region(
+                final_reftext,
+                final_seqtext,
+                seq.seqtext,
+                seqtype,
+                0,
+                0,
+                prev_ref_start,
+                prev_seq_start,
+                2
+            )
 
         aligned_positions: Set[int] = set()
+        unaligned_positions: Set[int] = set()
         for pos in final_seqtext:
-            if not (pos.flag & PositionFlag.UNALIGNED) and pos.pos > -1:
-                aligned_positions.add(pos.pos)
-        for idx, pos in enumerate(final_seqtext):
-            # Mask positions that has been aligned but repeated used as
-            # unaligned. This is typically happened when sequence was
-            # incorrectly concatenated. e.g. RT + PR
-            if pos.flag & PositionFlag.UNALIGNED and \
-                    pos.pos > -1 and pos.pos in aligned_positions:
-                final_seqtext[idx] = seqtype.init_gaps(1)[0]
+            if pos.pos > -1:
+                if pos.flag & PositionFlag.UNALIGNED:
+                    unaligned_positions.add(pos.pos)
+                else:
+                    aligned_positions.add(pos.pos)
+        # Mask positions that has been aligned but repeated used as
+        # unaligned. This is typically happened when sequence was
+        # incorrectly concatenated. e.g. RT + PR
+        repeated_positions: Set[int] = aligned_positions & unaligned_positions
+        if repeated_positions:
+            for idx, pos in enumerate(final_seqtext):
+                if pos.flag & PositionFlag.UNALIGNED and \
+                        pos.pos in repeated_positions:
+                    final_seqtext[idx] = seqtype.init_gaps(1)[0]
 
         yield (
             refseq.push_seqtext(
@@ -7,6 +7,8 @@ ReturnType = TypeVar('ReturnType', Iterable[RefSeqPair], Iterable[str])
 
 
 class Processor(Generic[ReturnType]):
+    __slots__ = ('command_name', 'is_output_command', '_processor')
+
     command_name: str
     is_output_command: bool
     _processor: Callable[
@@ -7,8 +7,8 @@ from itertools import chain, groupby
 from ..cli import cli
 from ..utils import group_by_codons, find_codon_trim_slice
 from ..models import Sequence, RefSeqPair, NAPosition
-from ..utils.codonutils import translate_codons
-from ..utils.iupac import iupac_score
+from ..utils.codonutils import translate_codons_bytes
+from ..utils.iupac import iupac_score_sum
 from ..utils.blosum62 import blosum62_score
 
 from ..processor import intermediate_processor, Processor
@@ -34,6 +34,17 @@ CodonPair = Tuple[
 ]
 
 
+@cython.cfunc
+@cython.inline
+@cython.returns(cython.bint)
+def _has_gap(nas: List[NAPosition]) -> bool:
+    na: NAPosition
+    for na in nas:
+        if na.is_gap:
+            return True
+    return False
+
+
 @cython.cfunc
 @cython.inline
 @cython.returns(tuple)
@@ -46,28 +57,26 @@ def extend_codons_until_gap(
     List[List[NAPosition]],
     int
 ]:
+    # walk outwards from the gap group (backwards for LEFT) by index
+    # instead of reversing the codon lists twice
+    idx: cython.int
+    size: cython.int = len(ref_codons)
     if direction == LEFT:
-        ref_codons.reverse()
-        seq_codons.reverse()
-    idx: int
-    refcd: List[NAPosition]
-    seqcd: List[NAPosition]
-    endidx: int = len(ref_codons)
-    for idx, (refcd, seqcd) in enumerate(zip(ref_codons, seq_codons)):
-        broken: bool = False
-        for na in chain(refcd, seqcd):
-            if na.is_gap:
-                endidx = idx
-                broken = True
-                break
-        if broken:
-            break
-    ref_codons = ref_codons[:endidx]
-    seq_codons = seq_codons[:endidx]
-    if direction == LEFT:
-        ref_codons.reverse()
-        seq_codons.reverse()
-    return ref_codons, seq_codons, len(ref_codons)
+        idx = size
+        while idx > 0 and not (
+            _has_gap(ref_codons[idx - 1]) or
+            _has_gap(seq_codons[idx - 1])
+        ):
+            idx -= 1
+        return ref_codons[idx:], seq_codons[idx:], size - idx
+    else:
+        idx = 0
+        while idx < size and not (
+            _has_gap(ref_codons[idx]) or
+            _has_gap(seq_codons[idx])
+        ):
+            idx += 1
+        return ref_codons[:idx], seq_codons[:idx], idx
 
 
 @cython.cfunc
@@ -140,19 +149,17 @@ def move_gap_to_codon_end(
 @cython.cfunc
 @cython.inline
 def calc_match_score(
-    mynas: List[NAPosition],
-    othernas: List[NAPosition],
+    mynas_bytes: bytes,
+    othernas_bytes: bytes,
+    otheraas: List[bytes],
     base_score: float
 ) -> float:
-    myna: NAPosition
-    otherna: NAPosition
     myaa: bytes
     otheraa: bytes
-    myaas: List[bytes] = translate_codons(mynas)
-    otheraas: List[bytes] = translate_codons(othernas)
-    score: float = base_score
-    for myna, otherna in zip(mynas, othernas):
-        score += iupac_score(myna.notation, otherna.notation)
+    # takes the notations as bytes and the translation of the other side,
+    # so the fixed side is only built once for all candidates
+    myaas: List[bytes] = translate_codons_bytes(mynas_bytes)
+    score: float = iupac_score_sum(mynas_bytes, othernas_bytes, base_score)
     for myaa, otheraa in zip(myaas, otheraas):
         score += blosum62_score(myaa, otheraa)
     return score
@@ -190,32 +197,48 @@ def find_best_matches(
     idx: int
     score: Tuple[float, int]
     mygap: List[NAPosition]
-    test_mynas: List[NAPosition]
     orig_gapidx: int = find_first_gap(mynas)
     mynas, mygap = separate_gaps_from_nas(mynas)
     gaplen: int = len(mygap)
     max_score: Optional[Tuple[float, int]] = None
-    best_mynas: Optional[List[NAPosition]] = None
+    best_idx: int = -1
     scanstart: int = 3 if gap_type == REFGAP else 0
     mynas_len: int = len(mynas)
+    # candidates are scored on bytes; only the best placement is built
+    # as a NAPosition list
+    mynas_bytes: bytes = NAPosition.as_bytes(mynas)
+    mygap_bytes: bytes = NAPosition.as_bytes(mygap)
+    othernas_bytes: bytes = NAPosition.as_bytes(othernas)
+    otheraas: List[bytes] = translate_codons_bytes(othernas_bytes)
+    # scores applicable to this gap size keyed by position only; a
+    # score of the exact size overrides the one of any size (0)
+    pos: int
+    size: int
+    pos_score: int
+    pos_scores: Dict[int, int] = {}
+    for (pos, size), pos_score in gap_placement_score.items():
+        if size == 0:
+            pos_scores.setdefault(pos, pos_score)
+        elif size == gaplen:
+            pos_scores[pos] = pos_score
     for idx in range(scanstart, mynas_len + 1, 3):
         napos: int
-        test_mynas = mynas[::]
-        test_mynas[idx:idx] = mygap
         base_score: float = float(-gaplen)
         if is_start and idx == 0:
             base_score = .0
         elif is_end and idx + 3 > mynas_len:
             base_score = .0
-        score_val: float = calc_match_score(test_mynas, othernas, base_score)
+        score_val: float = calc_match_score(
+            mynas_bytes[:idx] + mygap_bytes + mynas_bytes[idx:],
+            othernas_bytes,
+            otheraas,
+            base_score)
         if gap_type == REFGAP:
             napos = mynas[idx - 1].pos
         else:  # gap_type == SEQGAP
             napos = othernas[idx].pos
-        if (napos, gaplen) in gap_placement_score:
-            score_val += gap_placement_score[(napos, gaplen)]
-        elif (napos, 0) in gap_placement_score:
-            score_val += gap_placement_score[(napos, 0)]
+        if napos in pos_scores:
+            score_val += pos_scores[napos]
 
         if idx in bp1_indices:
             # reward gaps inserted between codons
@@ -227,11 +250,11 @@ def find_best_matches(
             score = (score_val, 0)
         if max_score is None or score > max_score:
             max_score = score
-            best_mynas = test_mynas
-    if best_mynas is None:
+            best_idx = idx
+    if best_idx < 0:
         # fallback to mynas, if no best match is found
-        best_mynas = mynas
-    return best_mynas
+        return mynas
+    return mynas[:best_idx] + mygap + mynas[best_idx:]
 
 
 @cython.cfunc
@@ -282,9 +305,9 @@ def codon_pairs_group_key(cdpair: Tuple[
     refcd: List[NAPosition]
     seqcd: List[NAPosition]
     _, (refcd, seqcd) = cdpair
-    if NAPosition.any_has_gap(refcd):
+    if _has_gap(refcd):
         return REFGAP
-    if NAPosition.any_has_gap(seqcd):
+    if _has_gap(seqcd):
         return SEQGAP
     return NOGAP
 
@@ -292,10 +315,23 @@ def codon_pairs_group_key(cdpair: Tuple[
 @cython.cfunc
 @cython.inline
 @cython.returns(list)
-def move_gaps_to_center(nas: List[NAPosition]) -> List[NAPosition]:
-    new_nas: List[NAPosition]
-    gaps: List[NAPosition]
-    new_nas, gaps = separate_gaps_from_nas(nas)
+def move_gaps_to_center(
+    nas: List[NAPosition],
+    n_redundant_gaps: int
+) -> List[NAPosition]:
+    """Remove the first `n_redundant_gaps` gaps and move the remaining
+    gaps to the center, in a single pass
+    """
+    na: NAPosition
+    new_nas: List[NAPosition] = []
+    gaps: List[NAPosition] = []
+    for na in nas:
+        if not na.is_gap:
+            new_nas.append(na)
+        elif n_redundant_gaps > 0:
+            n_redundant_gaps -= 1
+        else:
+            gaps.append(na)
     center_idx: int = len(new_nas) // 2
     new_nas[center_idx:center_idx] = gaps
     return new_nas
@@ -314,6 +350,7 @@ def gather_gaps(
 ]:
     """Gather gaps together according to window"""
     slicekey: slice
+    n_gaps: int
     win_refnas: List[NAPosition]
     win_seqnas: List[NAPosition]
     # reverse windows so the assignment won't change index
@@ -322,13 +359,10 @@ def gather_gaps(
     )):
         win_refnas = refnas[slicekey]
         win_seqnas = seqnas[slicekey]
-        win_refnas, win_seqnas = remove_redundant_gaps(win_refnas, win_seqnas)
+        n_gaps = count_redundant_gaps(win_refnas, win_seqnas)
 
-        win_refnas = move_gaps_to_center(win_refnas)
-        win_seqnas = move_gaps_to_center(win_seqnas)
-
-        refnas[slicekey] = win_refnas
-        seqnas[slicekey] = win_seqnas
+        refnas[slicekey] = move_gaps_to_center(win_refnas, n_gaps)
+        seqnas[slicekey] = move_gaps_to_center(win_seqnas, n_gaps)
 
     return refnas, seqnas
 
@@ -453,26 +487,11 @@ def realign_gaps(
 
 @cython.cfunc
 @cython.inline
-@cython.returns(list)
-def remove_n_gaps(nas: List[NAPosition], n_gaps: int) -> List[NAPosition]:
-    na: NAPosition
-    result: List[NAPosition] = []
-    for na in nas:
-        if na.is_gap and n_gaps > 0:
-            n_gaps -= 1
-        else:
-            result.append(na)
-    return result
-
-
-@cython.cfunc
-@cython.inline
-@cython.returns(tuple)
-def remove_redundant_gaps(
+def count_redundant_gaps(
     refnas: List[NAPosition],
     seqnas: List[NAPosition]
-) -> Tuple[List[NAPosition], List[NAPosition]]:
-    """Remove redundant gaps
+) -> int:
+    """Count redundant gaps
 
     Gap should only exist in either sequence but not both
 
@@ -490,10 +509,7 @@ def remove_redundant_gaps(
         NAPosition.count_gaps(refnas),
         NAPosition.count_gaps(seqnas)
     )
-    if n_gaps:
-        refnas = remove_n_gaps(refnas, n_gaps)
-        seqnas = remove_n_gaps(seqnas, n_gaps)
-    return refnas, seqnas
+    return n_gaps
 
 
 @cython.ccall
@@ -510,6 +526,10 @@ def codon_align(
     refnas: List[NAPosition] = refseq.seqtext
     seqnas: List[NAPosition] = seq.seqtext
 
+    if not _has_gap(refnas) and not _has_gap(seqnas):
+        # nothing to be codon aligned; skip locating the boundary
+        return refseq, seq
+
     seq_idx_start: int = 0
     seq_idx_end: int = len(seqnas)
 
@@ -550,8 +570,7 @@ def codon_align(
     # step 1: apply reading frame
     refnas = refnas[idx_start:idx_end]
     seqnas = seqnas[idx_start:idx_end]
-    if not NAPosition.any_has_gap(refnas) and \
-            not NAPosition.any_has_gap(seqnas):
+    if not _has_gap(refnas) and not _has_gap(seqnas):
         return refseq, seq
 
     # step 2: gather and re-align nearby gaps located in same window
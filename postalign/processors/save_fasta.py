@@ -1,5 +1,5 @@
 import click
-from typing import Iterable, Any
+from typing import Iterable, Optional, Any
 
 from ..cli import cli
 from ..models import RefSeqPair, Sequence
@@ -40,17 +40,23 @@ def save_fasta(
         idx: int
         refseq: Sequence
         seq: Sequence
+        prev_refseq: Optional[Sequence] = None
+        reftext: str = ''
         for idx, (refseq, seq) in enumerate(iterator):
             if (
                 pairwise or
                 (not preserve_order and idx == 0) or
                 (preserve_order and refseq.seqid + 1 == seq.seqid)
             ):
-                if modifiers:
-                    yield '>{}\n'.format(refseq.header_with_modifiers)
-                else:
-                    yield '>{}\n'.format(refseq.header)
-                yield '{}\n'.format(refseq.seqtext_as_str)
+                if refseq is not prev_refseq:
+                    # pairs often share one reference; format it once
+                    prev_refseq = refseq
+                    reftext = '>{}\n{}\n'.format(
+                        refseq.header_with_modifiers
+                        if modifiers else refseq.header,
+                        refseq.seqtext_as_str
+                    )
+                yield reftext
 
             if modifiers:
                 yield '>{}\n'.format(seq.header_with_modifiers)
@@ -1,13 +1,11 @@
 import orjson
 # import math
 import click
-from textwrap import indent
 from typing import Tuple, List, Iterable, TypedDict, Optional, Dict
-from more_itertools import chunked
 
 from ..cli import cli
-from ..utils import group_by_gene_codons, find_codon_trim_slice
-from ..utils.codonutils import translate_codon
+from ..utils import group_by_gene_codons_with_bytes, find_codon_trim_slice
+from ..utils.codonutils import translate_codon_bytes
 from ..models import RefSeqPair, NAPosition, Sequence, PositionFlag, Message
 from ..processor import Processor, output_processor
 
@@ -34,7 +32,9 @@ def gene_range_tuples_callback(
                     )
                 cur_range_chunks: List[Tuple[int, int]] = []
 
-                for refstart, refend in chunked(cur_ranges, 2):
+                for refstart, refend in zip(
+                    cur_ranges[::2], cur_ranges[1::2]
+                ):
                     if refstart < 1:
                         raise click.ClickException(
                             'argument <REF_START>:{} must be not less than 1'
@@ -115,7 +115,7 @@ def save_json(
         <GENE> <REF_START1> <REF_END1> <REF_START2> <REF_END2> ...
         Use to calculate codon position within the protein/gene.
     """
-    num_indent: int = 2
+    prefix: bytes = b' ' * 2
 
     @output_processor('save-json')
     def processor(
@@ -143,15 +143,21 @@ def save_json(
                 Tuple[
                     str,
                     List[List[NAPosition]],
-                    List[List[NAPosition]]
+                    List[List[NAPosition]],
+                    List[bytes],
+                    List[bytes]
                 ]
-            ] = group_by_gene_codons(
+            ] = group_by_gene_codons_with_bytes(
                 reftext, seqtext, gene_range_tuples)
 
             gene: str
             refcodons: List[List[NAPosition]]
             seqcodons: List[List[NAPosition]]
-            for gene, refcodons, seqcodons in gene_codons:
+            refcodon_bytes: List[bytes]
+            seqcodon_bytes: List[bytes]
+            for (
+                gene, refcodons, seqcodons, refcodon_bytes, seqcodon_bytes
+            ) in gene_codons:
                 pos0: int
                 refcd: List[NAPosition]
                 seqcd: List[NAPosition]
@@ -187,9 +193,11 @@ def save_json(
                         'RefCodonText': NAPosition.as_str(refcd[:3]),
                         'CodonText': codon_text,
                         'RefAminoAcidText': str(
-                            translate_codon(refcd[:3]), 'ASCII'),
+                            translate_codon_bytes(refcodon_bytes[pos0]),
+                            'ASCII'),
                         'AminoAcidText': str(
-                            translate_codon(seqcd[:3]), 'ASCII'),
+                            translate_codon_bytes(seqcodon_bytes[pos0]),
+                            'ASCII'),
                         'InsertedCodonsText': NAPosition.as_str(
                             seqcd[3:len(seqcd) - ins_fs_len]
                         ),
@@ -247,7 +255,12 @@ def save_json(
             text: bytes = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
             if idx > 0:
                 yield ',\n'
-            yield indent(str(text, 'ASCII'), prefix=' ' * num_indent)
+            # orjson never emits blank lines or raw newlines in strings,
+            # so indenting every line is a plain replace of the newlines
+            yield str(
+                prefix + text.replace(b'\n', b'\n' + prefix),
+                'ASCII'
+            )
         yield '\n]\n'
 
     return processor
@@ -1,4 +1,3 @@
-import re
 from typing import Iterable, Optional, Any
 
 from ..cli import cli
@@ -6,20 +5,20 @@ from ..models import Sequence, RefSeqPair
 
 from ..processor import Processor, intermediate_processor
 
-LEFT_TRIM_PATTERN: re.Pattern = re.compile(r'^[.-]+')
-RIGHT_TRIM_PATTERN: re.Pattern = re.compile(r'[.-]+$')
+GAP_CHARS = '.-'
 
 
 def find_trim_slice(seq: Sequence) -> slice:
-    left_trim: Optional[int] = None
+    # str.lstrip()/rstrip() scan the leading/trailing gaps in C; unlike
+    # a regex search for trailing gaps they never rescan inner gap runs
     seqtext_str: str = seq.seqtext_as_str
-    match: Optional[re.Match] = LEFT_TRIM_PATTERN.search(seqtext_str)
-    if match:
-        left_trim = match.span()[1]
-    right_trim: Optional[int] = None
-    match = RIGHT_TRIM_PATTERN.search(seqtext_str)
-    if match:
-        right_trim = match.span()[0]
+    seqlen: int = len(seqtext_str)
+    left_trim: Optional[int] = seqlen - len(seqtext_str.lstrip(GAP_CHARS))
+    if not left_trim:
+        left_trim = None
+    right_trim: Optional[int] = len(seqtext_str.rstrip(GAP_CHARS))
+    if right_trim == seqlen:
+        right_trim = None
     return slice(left_trim, right_trim)
 
 
@@ -32,14 +31,19 @@ def trim_by_ref() -> Processor[Iterable[RefSeqPair]]:
         iterator: Iterable[RefSeqPair],
         *args: Any
     ) -> Iterable[RefSeqPair]:
+        prev_refseq: Optional[Sequence] = None
+        trimmed_refseq: Sequence
+        sliceobj: slice = slice(None)
         for refseq, seq in iterator:
             if seq.seqtext == '':
                 # skip unaligned sequence
                 yield refseq, seq
                 continue
-            sliceobj = find_trim_slice(refseq)
-            refseq = refseq[sliceobj]
-            seq = seq[sliceobj]
-            yield refseq, seq
+            if refseq is not prev_refseq:
+                # MSA pairs share one reference; trim it once only
+                prev_refseq = refseq
+                sliceobj = find_trim_slice(refseq)
+                trimmed_refseq = refseq[sliceobj]
+            yield trimmed_refseq, seq[sliceobj]
 
     return processor
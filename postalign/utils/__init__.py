@@ -1,7 +1,13 @@
 from .group_by_codons import (
     group_by_codons,
     group_by_gene_codons,
+    group_by_codons_with_bytes,
+    group_by_gene_codons_with_bytes,
     find_codon_trim_slice
 )
 
-__all__ = ['group_by_codons', 'group_by_gene_codons', 'find_codon_trim_slice']
+__all__ = [
+    'group_by_codons', 'group_by_gene_codons',
+    'group_by_codons_with_bytes', 'group_by_gene_codons_with_bytes',
+    'find_codon_trim_slice'
+]
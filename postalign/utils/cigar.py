@@ -17,20 +17,26 @@ def _get_alignment(
 ) -> Tuple[List[Position], List[Position]]:
     num: int
     op: str
-    aligned_refseq: List[Position] = refseq[cigar.ref_start:]
-    aligned_seq: List[Position] = seq[cigar.seq_start:]
-    offset: int = 0
+    ref_offset: int = cigar.ref_start
+    seq_offset: int = cigar.seq_start
+    aligned_refseq: List[Position] = []
+    aligned_seq: List[Position] = []
+    # build both alignments front to back in one pass; inserting gaps into
+    # the middle of the full sequences shifted their tails on every op
     for num, op in cigar.cigar_tuple:
         if op == 'M':
-            offset += num
+            aligned_refseq.extend(refseq[ref_offset:ref_offset + num])
+            aligned_seq.extend(seq[seq_offset:seq_offset + num])
+            ref_offset += num
+            seq_offset += num
         elif op in ('D', 'N'):
-            aligned_seq[offset:offset] = seqtype.init_gaps(num)
-            offset += num
+            aligned_refseq.extend(refseq[ref_offset:ref_offset + num])
+            aligned_seq.extend(seqtype.init_gaps(num))
+            ref_offset += num
         elif op == 'I':
-            aligned_refseq[offset:offset] = seqtype.init_gaps(num)
-            offset += num
-    aligned_seq = aligned_seq[:offset]
-    aligned_refseq = aligned_refseq[:offset]
+            aligned_refseq.extend(seqtype.init_gaps(num))
+            aligned_seq.extend(seq[seq_offset:seq_offset + num])
+            seq_offset += num
     if len(aligned_refseq) != len(aligned_seq):
         raise ValueError(
             'Unmatched alignment length: {!r} and {!r}'
@@ -1,11 +1,12 @@
 import cython  # type: ignore
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from itertools import product
-from more_itertools import chunked
 from ..models import NAPosition
+from .iupac import IUPAC_MASK, POPCOUNT
 
 GAP_NA: int = ord(b'-')
 GAP_CODON: Tuple[int, int, int] = (GAP_NA,) * 3
+ACGT_BITS: int = 0x0F  # IUPAC_MASK bits of A, C, G and T
 
 CODON_TABLE: Dict[Tuple[int, ...], Tuple[int, ...]] = {
     tuple(b'TTT'): tuple(b'F'),
@@ -94,6 +95,33 @@ REVERSE_CODON_TABLE: Dict[int, List[bytes]] = {}
 for codon, aa in CODON_TABLE.items():
     REVERSE_CODON_TABLE.setdefault(aa[0], []).append(bytes(codon))
 
+# REVERSE_CODON_TABLE as an array indexed by AA ordinal
+AA2CODONS: List[Tuple[bytes, ...]] = [
+    tuple(REVERSE_CODON_TABLE.get(aa, ())) for aa in range(256)
+]
+
+# Unambiguous codons packed into a 6-bit index (2 bits per NA); NAs other
+# than ACGT are mapped to the sentinel 0xFF so they can be detected by OR
+NA2BIT: bytes = bytes(
+    b'ACGT'.index(na) if na in b'ACGT' else 0xFF
+    for na in range(256)
+)
+CODON_TABLE_64: bytes = bytes(
+    CODON_TABLE[(
+        b'ACGT'[idx >> 4],
+        b'ACGT'[idx >> 2 & 3],
+        b'ACGT'[idx & 3]
+    )][0]
+    for idx in range(64)
+)
+
+# translations as shared bytes objects, filled by _aas_as_bytes
+AAS_BYTES: Dict[Tuple[int, ...], bytes] = {}
+
+# translated codon bytes of each (fs_as, del_as) option pair, filled by
+# translate_codon_bytes; shared by all translation helpers
+CODON_TRANSLATIONS: Dict[Tuple[bytes, bytes], Dict[bytes, bytes]] = {}
+
 
 AMBIGUOUS_NAS: Dict[int, Tuple[int, ...]] = {
     ord(b'W'): tuple(b'AT'),
@@ -109,6 +137,24 @@ AMBIGUOUS_NAS: Dict[int, Tuple[int, ...]] = {
     ord(b'N'): tuple(b'ACGT')
 }
 
+# AMBIGUOUS_NAS as an array indexed by NA ordinal; an unambiguous (or
+# unknown) NA expands to itself
+UNAMBI_NAS: List[Tuple[int, ...]] = [
+    AMBIGUOUS_NAS.get(na, (na, )) for na in range(256)
+]
+
+
+@cython.cfunc
+@cython.inline
+def _codon_index(codon: bytes) -> cython.int:
+    """Index of an unambiguous codon in CODON_TABLE_64, or -1"""
+    na0: cython.int = NA2BIT[codon[0]]
+    na1: cython.int = NA2BIT[codon[1]]
+    na2: cython.int = NA2BIT[codon[2]]
+    if (na0 | na1 | na2) > 3:
+        return -1
+    return na0 << 4 | na1 << 2 | na2
+
 
 @cython.cfunc
 @cython.inline
@@ -132,19 +178,35 @@ def _translate_codon(
     na: int
     cand_nas: Tuple[int, ...]
     aas: Set[int] = set()
-    unambi_nas: List[Tuple[int, ...]] = []
-    for na in nas:
-        if na in AMBIGUOUS_NAS:
-            unambi_nas.append(AMBIGUOUS_NAS[na])
-        else:
-            unambi_nas.append((na, ))
-    for cand_nas in product(*unambi_nas):
+    for cand_nas in product(*[UNAMBI_NAS[na] for na in nas]):
         aas.add(CODON_TABLE[cand_nas][0])
     aas_tuple: Tuple[int, ...] = tuple(sorted(aas))
     CODON_TABLE[nas] = aas_tuple
     return aas_tuple
 
 
+@cython.cfunc
+@cython.inline
+@cython.returns(bytes)
+def _aas_as_bytes(aas: Tuple[int, ...]) -> bytes:
+    # reuse one bytes object per distinct translation (e.g. b'*CW')
+    aas_bytes: Optional[bytes] = AAS_BYTES.get(aas)
+    if aas_bytes is None:
+        aas_bytes = AAS_BYTES[aas] = bytes(aas)
+    return aas_bytes
+
+
+@cython.cfunc
+@cython.inline
+@cython.returns(dict)
+def _codon_translations(fs_as: bytes, del_as: bytes) -> Dict[bytes, bytes]:
+    key: Tuple[bytes, bytes] = (fs_as, del_as)
+    translations: Optional[Dict[bytes, bytes]] = CODON_TRANSLATIONS.get(key)
+    if translations is None:
+        translations = CODON_TRANSLATIONS[key] = {}
+    return translations
+
+
 @cython.ccall
 @cython.returns(bytes)
 def translate_codon(
@@ -152,13 +214,33 @@ def translate_codon(
     fs_as: bytes = b'X',
     del_as: bytes = b'-'
 ) -> bytes:
-    nas = nas[:3]
-    nas_bytes: bytes = NAPosition.as_bytes(nas)
-    aas: Tuple[int, ...] = _translate_codon(
-        tuple(nas_bytes),
-        tuple(fs_as),
-        tuple(del_as))
-    return bytes(aas)
+    aas_bytes: bytes = translate_codon_bytes(
+        NAPosition.as_bytes(nas[:3]), fs_as, del_as)
+    return aas_bytes
+
+
+@cython.ccall
+@cython.returns(bytes)
+def translate_codon_bytes(
+    nas_bytes: bytes,
+    fs_as: bytes = b'X',
+    del_as: bytes = b'-'
+) -> bytes:
+    """Same as translate_codon() but accepts codon notations as bytes"""
+    idx: cython.int
+    if len(nas_bytes) == 3:
+        idx = _codon_index(nas_bytes)
+        if idx > -1:
+            return CODON_TABLE_64[idx:idx + 1]
+    translations: Dict[bytes, bytes] = _codon_translations(fs_as, del_as)
+    aas_bytes: Optional[bytes] = translations.get(nas_bytes)
+    if aas_bytes is None:
+        aas: Tuple[int, ...] = _translate_codon(
+            tuple(nas_bytes),
+            tuple(fs_as),
+            tuple(del_as))
+        aas_bytes = translations[nas_bytes] = _aas_as_bytes(aas)
+    return aas_bytes
 
 
 @cython.ccall
@@ -168,24 +250,57 @@ def translate_codons(
     fs_as: bytes = b'X',
     del_as: bytes = b'-'
 ) -> List[bytes]:
-    nas_bytes: bytes = NAPosition.as_bytes(nas)
-    codon: List[int]
-    fs_as_tuple: Tuple[int, ...] = tuple(fs_as)
-    del_as_tuple: Tuple[int, ...] = tuple(del_as)
+    all_aas: List[bytes] = translate_codons_bytes(
+        NAPosition.as_bytes(nas), fs_as, del_as)
+    return all_aas
+
+
+@cython.ccall
+@cython.returns(list)
+def translate_codons_bytes(
+    nas_bytes: bytes,
+    fs_as: bytes = b'X',
+    del_as: bytes = b'-'
+) -> List[bytes]:
+    """Same as translate_codons() but accepts NA notations as bytes"""
+    i: cython.int
+    idx: cython.int
     all_aas: List[bytes] = []
-    for codon in chunked(nas_bytes, 3):
-        aas: Tuple[int, ...] = _translate_codon(
-            tuple(codon),
-            fs_as_tuple,
-            del_as_tuple)
-        all_aas.append(bytes(aas))
+    nas_len: cython.int = len(nas_bytes)
+    # encode all NAs at once; bytes.translate maps every byte in C
+    nas_bits: bytes = nas_bytes.translate(NA2BIT)
+    if nas_len % 3 == 0 and 0xFF not in nas_bits:
+        # fast path: whole sequence is unambiguous with no partial codon
+        for i in range(0, nas_len, 3):
+            idx = nas_bits[i] << 4 | nas_bits[i + 1] << 2 | nas_bits[i + 2]
+            all_aas.append(CODON_TABLE_64[idx:idx + 1])
+        return all_aas
+
+    # codons with gaps, ambiguous NAs or a partial codon: one dict
+    # lookup per codon once translated
+    codon: bytes
+    aas_bytes: Optional[bytes]
+    translations: Dict[bytes, bytes] = _codon_translations(fs_as, del_as)
+    for i in range(0, nas_len, 3):
+        codon = nas_bytes[i:i + 3]
+        aas_bytes = translations.get(codon)
+        if aas_bytes is None:
+            aas_bytes = translate_codon_bytes(codon, fs_as, del_as)
+        all_aas.append(aas_bytes)
     return all_aas
 
 
 @cython.ccall
 @cython.returns(list)
 def get_codons(aa: int) -> List[bytes]:
-    return REVERSE_CODON_TABLE[aa]
+    # out-of-range ordinals must not index (or wrap around) the array
+    if not 0 <= aa < 256:
+        raise KeyError(aa)
+    codons: Tuple[bytes, ...] = AA2CODONS[aa]
+    if not codons:
+        raise KeyError(aa)
+    # return a new list so callers can't modify the cached codons
+    return list(codons)
 
 
 @cython.ccall
@@ -194,21 +309,21 @@ def compare_codon(
     base: bytes,
     target: bytes
 ) -> bool:
-    ha: int
     sna: int
     tna: int
+    smask: cython.int
+    tmask: cython.int
     # we assume that "base" contains only unambiguous NAs
-    for ha in b'BDHVN':
-        if ha in target:
+    for tna in target:
+        if POPCOUNT[IUPAC_MASK[tna] & ACGT_BITS] > 2:
             # false if highly ambiguous NA were found
             return False
     for sna, tna in zip(base, target):
-        if tna in b'ACGT':
-            if tna != sna:
-                break
-        else:
-            if sna not in AMBIGUOUS_NAS[tna]:
-                break
-    else:
-        return True
-    return False
+        tmask = IUPAC_MASK[tna] & ACGT_BITS
+        if not tmask:
+            raise KeyError(tna)
+        # match if sna is a single NA covered by tna
+        smask = IUPAC_MASK[sna] & ACGT_BITS
+        if POPCOUNT[smask] != 1 or not smask & tmask:
+            return False
+    return True
@@ -1,7 +1,24 @@
+import re
 import cython  # type: ignore
-from typing import Optional, Tuple, List
+from typing import Any, Callable, Tuple, List
 from ..models import NAPosition
 
+# up to three non-gap NAs and the gaps in between them
+REF_CODON_PATTERN: re.Pattern = re.compile(rb'[^.-](?:[.-]*[^.-]){0,2}')
+
+
+@cython.cfunc
+@cython.inline
+@cython.returns(list)
+def _codon_starts(refbytes: bytes) -> List[int]:
+    # a codon begins at every third non-gap NA of the reference; locate
+    # the boundaries with the regex engine instead of walking each NA
+    starts: List[int] = [
+        match.start() for match in REF_CODON_PATTERN.finditer(refbytes)
+    ]
+    starts.append(len(refbytes))
+    return starts
+
 
 @cython.ccall
 @cython.returns(tuple)
@@ -12,47 +29,126 @@ def group_by_codons(
     List[List[NAPosition]],
     List[List[NAPosition]]
 ]:
+    idx: cython.int
+    start: cython.int
+    end: cython.int
+    size: cython.int = min(len(refnas), len(seqnas))
     refcodons: List[List[NAPosition]] = []
     seqcodons: List[List[NAPosition]] = []
-    lastrefcodon: Optional[List[NAPosition]] = None
-    lastseqcodon: Optional[List[NAPosition]] = None
-    bp = -1
-    for refna, seqna in zip(refnas, seqnas):
-        if not refna.is_gap:
-            bp = (bp + 1) % 3
-            if bp == 0:
-                # begin new codon
-                lastrefcodon = []
-                lastseqcodon = []
-                refcodons.append(lastrefcodon)
-                seqcodons.append(lastseqcodon)
-        if lastrefcodon is not None and lastseqcodon is not None:
-            lastrefcodon.append(refna)
-            lastseqcodon.append(seqna)
+    starts: List[int] = _codon_starts(NAPosition.as_bytes(refnas[:size]))
+    for idx in range(len(starts) - 1):
+        start = starts[idx]
+        end = starts[idx + 1]
+        refcodons.append(refnas[start:end])
+        seqcodons.append(seqnas[start:end])
     return refcodons, seqcodons
 
 
+@cython.ccall
+@cython.returns(tuple)
+def group_by_codons_with_bytes(
+    refnas: List[NAPosition],
+    seqnas: List[NAPosition]
+) -> Tuple[
+    List[List[NAPosition]],
+    List[List[NAPosition]],
+    List[bytes],
+    List[bytes]
+]:
+    """Same as group_by_codons() but also returns the notation bytes of
+    the first three NAs of each codon, reusing the bytes of the grouping
+    pass; callers translate only the codons they actually emit
+    """
+    idx: cython.int
+    start: cython.int
+    end: cython.int
+    stop: cython.int
+    size: cython.int = min(len(refnas), len(seqnas))
+    refcodons: List[List[NAPosition]] = []
+    seqcodons: List[List[NAPosition]] = []
+    refcodon_bytes: List[bytes] = []
+    seqcodon_bytes: List[bytes] = []
+    refbytes: bytes = NAPosition.as_bytes(refnas[:size])
+    seqbytes: bytes = NAPosition.as_bytes(seqnas[:size])
+    starts: List[int] = _codon_starts(refbytes)
+    for idx in range(len(starts) - 1):
+        start = starts[idx]
+        end = starts[idx + 1]
+        stop = min(start + 3, end)
+        refcodons.append(refnas[start:end])
+        seqcodons.append(seqnas[start:end])
+        refcodon_bytes.append(refbytes[start:stop])
+        seqcodon_bytes.append(seqbytes[start:stop])
+    return refcodons, seqcodons, refcodon_bytes, seqcodon_bytes
+
+
+@cython.cfunc
+@cython.inline
+@cython.returns(cython.bint)
+def _codon_has_base(codon: List[NAPosition]) -> bool:
+    na: NAPosition
+    for na in codon:
+        if not na.is_gap:
+            return True
+    return False
+
+
 @cython.ccall
 @cython.returns(slice)
 def find_codon_trim_slice(
     codons: List[List[NAPosition]]
 ) -> slice:
-    left_trim: int = 0
-    for idx, codon in enumerate(codons):
-        if NAPosition.all_have_gap(codon):
-            left_trim = idx + 1
-        else:
-            break
-    codons_len: int = len(codons)
-    right_trim: int = codons_len
-    for idx, codon in enumerate(reversed(codons)):
-        if NAPosition.all_have_gap(codon):
-            right_trim = codons_len - 1 - idx
-        else:
-            break
+    codons_len: cython.int = len(codons)
+    left_trim: cython.int = 0
+    while left_trim < codons_len and not _codon_has_base(codons[left_trim]):
+        left_trim += 1
+    if left_trim == codons_len:
+        # all codons are gaps; skip the backward scan
+        return slice(codons_len, 0)
+    right_trim: cython.int = codons_len
+    while not _codon_has_base(codons[right_trim - 1]):
+        right_trim -= 1
     return slice(left_trim, right_trim)
 
 
+@cython.cfunc
+@cython.returns(list)
+def _group_by_gene(
+    refnas: List[NAPosition],
+    seqnas: List[NAPosition],
+    gene_range_tuples: List[Tuple[str, List[Tuple[int, int]]]],
+    grouper: Callable[..., Tuple[List[Any], ...]],
+    width: int
+) -> List[Tuple[Any, ...]]:
+    gene: str
+    ranges: List[Tuple[int, int]]
+    results: List[Tuple[Any, ...]] = []
+
+    for gene, ranges in gene_range_tuples:
+        partials: List[Tuple[List[Any], ...]] = []
+        total: int = 0
+        for refstart, refend in ranges:
+            idxstart, idxend = NAPosition.posrange2indexrange(
+                refnas, refstart, refend)
+            partial: Tuple[List[Any], ...] = grouper(
+                refnas[idxstart:idxend],
+                seqnas[idxstart:idxend]
+            )
+            partials.append(partial)
+            total += len(partial[0])
+
+        # preallocate with the exact codon count and fill by slices
+        columns: List[List[Any]] = [[None] * total for _ in range(width)]
+        offset: int = 0
+        for partial in partials:
+            size: int = len(partial[0])
+            for column, values in zip(columns, partial):
+                column[offset:offset + size] = values
+            offset += size
+        results.append((gene, *columns))
+    return results
+
+
 @cython.ccall
 @cython.returns(list)
 def group_by_gene_codons(
@@ -66,27 +162,40 @@ def group_by_gene_codons(
         List[List[NAPosition]]
     ]
 ]:
-    gene: str
-    ranges: List[Tuple[int, int]]
     results: List[
         Tuple[
             str,
             List[List[NAPosition]],
             List[List[NAPosition]]
         ]
-    ] = []
+    ] = _group_by_gene(
+        refnas, seqnas, gene_range_tuples, group_by_codons, 2)
+    return results
 
-    for gene, ranges in gene_range_tuples:
-        refcodons = []
-        seqcodons = []
-        for refstart, refend in ranges:
-            idxstart, idxend = NAPosition.posrange2indexrange(
-                refnas, refstart, refend)
-            partial_refcodons, partial_seqcodons = group_by_codons(
-                refnas[idxstart:idxend],
-                seqnas[idxstart:idxend]
-            )
-            refcodons.extend(partial_refcodons)
-            seqcodons.extend(partial_seqcodons)
-        results.append((gene, refcodons, seqcodons))
+
+@cython.ccall
+@cython.returns(list)
+def group_by_gene_codons_with_bytes(
+    refnas: List[NAPosition],
+    seqnas: List[NAPosition],
+    gene_range_tuples: List[Tuple[str, List[Tuple[int, int]]]]
+) -> List[
+    Tuple[
+        str,
+        List[List[NAPosition]],
+        List[List[NAPosition]],
+        List[bytes],
+        List[bytes]
+    ]
+]:
+    results: List[
+        Tuple[
+            str,
+            List[List[NAPosition]],
+            List[List[NAPosition]],
+            List[bytes],
+            List[bytes]
+        ]
+    ] = _group_by_gene(
+        refnas, seqnas, gene_range_tuples, group_by_codons_with_bytes, 4)
     return results
@@ -1,5 +1,7 @@
 import cython  # type: ignore
-from typing import Dict, Set
+from typing import Dict, Set, List, Optional
+
+GAP_NA: int = ord(b'-')
 
 IUPAC: Dict[int, Set[int]] = {
     ord(b'A'): set(b'A'),
@@ -20,19 +22,96 @@ IUPAC: Dict[int, Set[int]] = {
     ord(b'-'): set(b'-')
 }
 
+# Bitmask encoding of IUPAC: each unambiguous notation takes a bit, an
+# ambiguous notation is the union of its expansion. Stored as a 256-byte
+# table so that a lookup is a single byte fetch by ASCII ordinal.
+IUPAC_BITS: Dict[int, int] = {
+    ord(b'A'): 0x01,
+    ord(b'C'): 0x02,
+    ord(b'G'): 0x04,
+    ord(b'T'): 0x08,
+    ord(b'-'): 0x10
+}
 
-@cython.ccall
-def iupac_score(
-    na_a: int,
-    na_b: int,
-    del_as: int = ord(b'-')
-) -> float:
+
+def _build_mask_table() -> bytes:
+    na: int
+    expand: Set[int]
+    table: bytearray = bytearray(256)
+    for na, expand in IUPAC.items():
+        for one in expand:
+            table[na] |= IUPAC_BITS[one]
+    return bytes(table)
+
+
+IUPAC_MASK: bytes = _build_mask_table()
+POPCOUNT: bytes = bytes(bin(mask).count('1') for mask in range(32))
+
+
+def _calc_score(na_a: int, na_b: int, del_as: int) -> float:
     if na_a == na_b == del_as:
         # both are in-frame deletions, no penalty applied
         return 0
     elif na_a == na_b:
         return 1
     else:
-        expand_a: Set[int] = IUPAC[na_a]
-        expand_b: Set[int] = IUPAC[na_b]
-        return - len(expand_a ^ expand_b) / len(expand_a | expand_b)
+        mask_a: int = IUPAC_MASK[na_a]
+        mask_b: int = IUPAC_MASK[na_b]
+        if not mask_a:
+            raise KeyError(na_a)
+        if not mask_b:
+            raise KeyError(na_b)
+        return - POPCOUNT[mask_a ^ mask_b] / POPCOUNT[mask_a | mask_b]
+
+
+def _build_score_table() -> List[Optional[float]]:
+    """Scores of all notation pairs, indexed by na_a << 8 | na_b
+
+    Pairs involving a non-IUPAC notation are None, unless both
+    notations are identical.
+    """
+    na: int
+    na_a: int
+    na_b: int
+    table: List[Optional[float]] = [None] * 0x10000
+    for na in range(256):
+        table[na << 8 | na] = _calc_score(na, na, GAP_NA)
+    for na_a in IUPAC:
+        for na_b in IUPAC:
+            table[na_a << 8 | na_b] = _calc_score(na_a, na_b, GAP_NA)
+    return table
+
+
+IUPAC_SCORES: List[Optional[float]] = _build_score_table()
+
+
+@cython.ccall
+def iupac_score(
+    na_a: int,
+    na_b: int,
+    del_as: int = GAP_NA
+) -> float:
+    if del_as != GAP_NA:
+        return _calc_score(na_a, na_b, del_as)
+    score: Optional[float] = IUPAC_SCORES[na_a << 8 | na_b]
+    if score is None:
+        raise KeyError(na_b if IUPAC_MASK[na_a] else na_a)
+    return score
+
+
+@cython.ccall
+def iupac_score_sum(
+    nas_a: bytes,
+    nas_b: bytes,
+    score: float = .0
+) -> float:
+    """Accumulate iupac_score() of paired notations onto `score`"""
+    na_a: int
+    na_b: int
+    one: Optional[float]
+    for na_a, na_b in zip(nas_a, nas_b):
+        one = IUPAC_SCORES[na_a << 8 | na_b]
+        if one is None:
+            raise KeyError(na_b if IUPAC_MASK[na_a] else na_a)
+        score += one
+    return score
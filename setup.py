@@ -5,7 +5,6 @@ import os
 import re
 import ast
 import setuptools
-from Cython.Build import cythonize  # type: ignore
 from typing import Optional, List, Set
 from setuptools.extension import Extension
 
@@ -21,6 +20,10 @@ extensions = [
         name='postalign.models.na_position',
         sources=['postalign/models/na_position.py']
     ),
+    Extension(
+        name='postalign.parsers.paf',
+        sources=['postalign/parsers/paf.py']
+    ),
     Extension(
         name='postalign.models._sequence',
         sources=['postalign/models/_sequence.py']
@@ -71,6 +74,24 @@ def req(filename: str) -> List[str]:
     return list(requires)
 
 
+def ext_modules() -> List[Extension]:
+    # set POSTALIGN_NO_CYTHON=1 to install the pure-Python modules only
+    if os.environ.get('POSTALIGN_NO_CYTHON'):
+        return []
+    from Cython.Build import cythonize  # type: ignore
+    modules: List[Extension] = cythonize(
+        extensions,
+        # unchanged modules are skipped; changed ones are built in parallel
+        nthreads=os.cpu_count() or 1,
+        compiler_directives={
+            'language_level': '3',
+            'profile': False,
+            'linetrace': False
+        }
+    )
+    return modules
+
+
 if __name__ == '__main__':
     setuptools.setup(
         name='post-align',
@@ -89,14 +110,7 @@ if __name__ == '__main__':
         ],
         package_data={"postalign": ["py.typed"]},
         install_requires=req('requirements.txt'),
-        ext_modules=cythonize(
-            extensions,
-            compiler_directives={
-                'language_level': '3',
-                'profile': False,
-                'linetrace': False
-            }
-        ),
+        ext_modules=ext_modules(),
         # tests_require=reqs('test-requirements.txt'),
         # include_package_data=True,
         entry_points={'console_scripts': [